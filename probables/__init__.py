@@ -3,6 +3,7 @@
 from typing import List
 
 from probables.blooms import (
+    BlockedBloomFilter,
     BloomFilter,
     BloomFilterOnDisk,
     CountingBloomFilter,
@@ -33,6 +34,7 @@ __bugtrack_url__ = "https://github.com/barrust/pyprobables/issues"
 __all__ = [
     "BloomFilter",
     "BloomFilterOnDisk",
+    "BlockedBloomFilter",
     "CountingBloomFilter",
     "CountMinSketch",
     "CountMeanSketch",
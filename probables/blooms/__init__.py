@@ -1,5 +1,6 @@
 """ Bloom Filters """
 
+from probables.blooms.blockedbloom import BlockedBloomFilter
 from probables.blooms.bloom import BloomFilter, BloomFilterOnDisk
 from probables.blooms.countingbloom import CountingBloomFilter
 from probables.blooms.expandingbloom import ExpandingBloomFilter, RotatingBloomFilter
@@ -7,6 +8,7 @@ from probables.blooms.expandingbloom import ExpandingBloomFilter, RotatingBloomF
 __all__ = [
     "BloomFilter",
     "BloomFilterOnDisk",
+    "BlockedBloomFilter",
     "CountingBloomFilter",
     "ExpandingBloomFilter",
     "RotatingBloomFilter",
@@ -0,0 +1,182 @@
+""" BlockedBloomFilter, python implementation
+    License: MIT
+    Author: Tyler Barrus (barrust@gmail.com)
+    URL: https://github.com/barrust/pyprobables
+"""
+import math
+from pathlib import Path
+from typing import Union
+
+from probables.blooms.bloom import _BIT_MASKS, BloomFilter
+from probables.hashes import HashFuncT, HashResultsT
+
+MISMATCH_MSG = "The parameter second must be of type BlockedBloomFilter"
+
+
+def _verify_not_type_mismatch(second: "BlockedBloomFilter") -> bool:
+    """verify that there is not a type mismatch"""
+    return isinstance(second, (BlockedBloomFilter))
+
+
+class BlockedBloomFilter(BloomFilter):
+    """Blocked Bloom Filter implementation for use in python; all the bits
+    for an element are set within a single 64 byte (512 bit) block, the size
+    of a common cache line, so that each insert or lookup touches a single
+    region of the bit array instead of `number_hashes` random locations.
+
+    Args:
+        est_elements (int): The number of estimated elements to be added
+        false_positive_rate (float): The desired false positive rate
+        filepath (str): Path to file to load
+        hex_string (str): Hex based representation to be loaded
+        hash_function (function): Hashing strategy function to use `hf(key, number)`
+    Returns:
+        BlockedBloomFilter: A Blocked Bloom Filter object
+    Note:
+        Initialization order of operations:
+            1) From file
+            2) From Hex String
+            3) From params
+    Note:
+        The number of bits is rounded up to a whole number of blocks; the export \
+            format matches the BloomFilter but the bit layout does not, so exports \
+            are only loadable as a BlockedBloomFilter
+    Note:
+        Keys are not spread evenly across the blocks, so the actual false positive \
+            rate is higher than the requested `false_positive_rate` (roughly 0.013 \
+            for 0.01 and 0.0016 for 0.001 when full); the filter is not resized to \
+            compensate. Use `current_false_positive_rate` for the blocked estimate"""
+
+    __slots__ = ("_num_blocks",)
+
+    _BLOCK_BITS = 512
+
+    def __init__(
+        self,
+        est_elements: Union[int, None] = None,
+        false_positive_rate: Union[float, None] = None,
+        filepath: Union[str, Path, None] = None,
+        hex_string: Union[str, None] = None,
+        hash_function: Union[HashFuncT, None] = None,
+    ) -> None:
+        """setup the basic values needed"""
+        self._num_blocks = 0
+        super().__init__(est_elements, false_positive_rate, filepath, hex_string, hash_function)
+
+    def _load_init(self, filepath, hash_function, hex_string, est_elements, false_positive_rate):
+        """Handle setting params and loading everything as needed"""
+        self._type = "blocked"
+        super()._load_init(filepath, hash_function, hex_string, est_elements, false_positive_rate)
+
+    @property
+    def number_blocks(self) -> int:
+        """int: The number of 64 byte blocks in the Blocked Bloom Filter
+
+        Note:
+            Not settable"""
+        return self._num_blocks
+
+    def current_false_positive_rate(self) -> float:
+        """Calculate the current false positive rate based on elements added
+
+        Return:
+            float: The current false positive rate
+        Note:
+            Unlike the standard Bloom Filter estimate, this accounts for the uneven \
+                (poisson distributed) number of elements in each block"""
+        if self.elements_added == 0:
+            return 0.0
+        lam = self.elements_added / self._num_blocks
+        log_lam = math.log(lam)
+        spread = 10 * math.sqrt(lam) + 10
+        res = 0.0
+        for i in range(max(0, int(lam - spread)), int(lam + spread) + 1):
+            prob = math.exp(i * log_lam - lam - math.lgamma(i + 1))
+            res += prob * math.pow(1 - math.pow(1 - 1 / self._BLOCK_BITS, self.number_hashes * i), self.number_hashes)
+        return min(res, 1.0)
+
+    def add_alt(self, hashes: HashResultsT) -> None:
+        """Add the element represented by hashes into the Blocked Bloom Filter
+
+        Args:
+            hashes (list): A list of integers representing the key to insert"""
+        bloom = self._bloom
+        offset = ((hashes[0] >> 9) % self._num_blocks) << 6
+        for i in range(self._number_hashes):
+            k = hashes[i] & 511
+            bloom[offset + (k >> 3)] |= _BIT_MASKS[k & 7]
+        self._els_added += 1
+
+    def check_alt(self, hashes: HashResultsT) -> bool:
+        """Check if the element represented by hashes is in the Blocked Bloom Filter
+
+        Args:
+            hashes (list): A list of integers representing the key to check
+        Returns:
+            bool: True if likely encountered, False if definately not"""
+        bloom = self._bloom
+        offset = ((hashes[0] >> 9) % self._num_blocks) << 6
+        for i in range(self._number_hashes):
+            k = hashes[i] & 511
+            if not bloom[offset + (k >> 3)] & _BIT_MASKS[k & 7]:
+                return False
+        return True
+
+    def intersection(self, second: "BlockedBloomFilter") -> Union["BlockedBloomFilter", None]:  # type: ignore
+        """Return a new Blocked Bloom Filter that contains the intersection of the two
+
+        Args:
+            second (BlockedBloomFilter): The Blocked Bloom Filter with which to take the intersection
+        Returns:
+            BlockedBloomFilter: The new Blocked Bloom Filter containing the intersection
+        Raises:
+            TypeError: When second is not a :class:`BlockedBloomFilter`
+        Note:
+            If `second` is not of the same size (false_positive_rate and est_elements) then this will return `None`"""
+        if not _verify_not_type_mismatch(second):
+            raise TypeError(MISMATCH_MSG)
+
+        return super().intersection(second)  # type: ignore
+
+    def union(self, second: "BlockedBloomFilter") -> Union["BlockedBloomFilter", None]:  # type: ignore
+        """Return a new Blocked Bloom Filter that contains the union of the two
+
+        Args:
+            second (BlockedBloomFilter): The Blocked Bloom Filter with which to calculate the union
+        Returns:
+            BlockedBloomFilter: The new Blocked Bloom Filter containing the union
+        Raises:
+            TypeError: When second is not a :class:`BlockedBloomFilter`
+        Note:
+            If `second` is not of the same size (false_positive_rate and est_elements) then this will return `None`"""
+        if not _verify_not_type_mismatch(second):
+            raise TypeError(MISMATCH_MSG)
+
+        return super().union(second)  # type: ignore
+
+    def jaccard_index(self, second: "BlockedBloomFilter") -> Union[float, None]:  # type: ignore
+        """Calculate the jaccard similarity score between two Blocked Bloom Filters
+
+        Args:
+            second (BlockedBloomFilter): The Blocked Bloom Filter to compare with
+        Returns:
+            float: A numeric value between 0 and 1 where 1 is identical and 0 means completely different
+        Raises:
+            TypeError: When second is not a :class:`BlockedBloomFilter`
+        Note:
+            If `second` is not of the same size (false_positive_rate and est_elements) then this will return `None`"""
+        if not _verify_not_type_mismatch(second):
+            raise TypeError(MISMATCH_MSG)
+        return super().jaccard_index(second)
+
+    def _set_values(
+        self,
+        est_els: int,
+        fpr: float,
+        n_hashes: int,
+        n_bits: int,
+        hash_func: Union[HashFuncT, None],
+    ) -> None:
+        """round the number of bits up to a whole number of blocks"""
+        self._num_blocks = (n_bits + self._BLOCK_BITS - 1) // self._BLOCK_BITS
+        super()._set_values(est_els, fpr, n_hashes, self._num_blocks * self._BLOCK_BITS, hash_func)
@@ -6,28 +6,45 @@
 import math
 import os
 from array import array
-from binascii import hexlify, unhexlify
+from functools import lru_cache
 from io import BytesIO, IOBase
 from mmap import mmap
 from numbers import Number
 from pathlib import Path
 from shutil import copyfile
 from struct import Struct
-from textwrap import wrap
-from typing import ByteString, Tuple, Union
+from typing import ByteString, Iterable, List, Tuple, Union
 
+from probables.constants import LN_2, LN_2_SQUARED
 from probables.exceptions import InitializationError, NotSupportedError
 from probables.hashes import HashFuncT, HashResultsT, KeyT, default_fnv_1a
-from probables.utilities import MMap, is_hex_string, is_valid_file, resolve_path
+from probables.utilities import MMap, is_hex_string, is_valid_file, popcount, popcount_int, resolve_path
 
 MISMATCH_MSG = "The parameter second must be of type BloomFilter or a BloomFilterOnDisk"
 
 SimpleBloomT = Union["BloomFilter", "BloomFilterOnDisk"]
 
+# the single bit mask for each bit position within a byte
+_BIT_MASKS = (1, 2, 4, 8, 16, 32, 64, 128)
 
-def _verify_not_type_mismatch(second: SimpleBloomT) -> bool:
-    """verify that there is not a type mismatch"""
-    return isinstance(second, (BloomFilter, BloomFilterOnDisk))
+# c literal for each possible byte value and how many fit on an 80 character line
+_C_HEX_BYTES = tuple(f"0x{i:02x}" for i in range(256))
+_C_HEX_BYTES_PER_LINE = 13
+# description of each type of Bloom Filter used in the c header export
+_C_HEADER_BLOOM_TYPES = {
+    "regular": "standard BloomFilter",
+    "regular-on-disk": "standard BloomFilter",
+    "blocked": "BlockedBloomFilter",
+    "counting": "CountingBloomFilter",
+}
+
+
+def _verify_not_type_mismatch(first: SimpleBloomT, second: SimpleBloomT) -> bool:
+    """verify that there is not a type mismatch; the standard and on disk Bloom
+    Filters share a bit layout, all other types only match themselves"""
+    if not isinstance(second, (BloomFilter, BloomFilterOnDisk)):
+        return False
+    return first._type == second._type or {first._type, second._type} == {"regular", "regular-on-disk"}
 
 
 class BloomFilter:
@@ -79,7 +96,7 @@ class BloomFilter:
         self._fpr = 0.0
         self._bloom_length = 0
         self._est_elements = 0
-        self._bits_per_elm = 8.0
+        self._bits_per_elm = 8
         self._bloom: array
         self._hash_func: HashFuncT
         self._els_added = 0
@@ -215,8 +232,7 @@ class BloomFilter:
     def clear(self) -> None:
         """Clear or reset the Counting Bloom Filter"""
         self._els_added = 0
-        for idx in range(self._bloom_length):
-            self._bloom[idx] = 0
+        self._bloom[:] = array(self._typecode, [0]) * self._bloom_length
 
     def hashes(self, key: KeyT, depth: Union[int, None] = None) -> HashResultsT:
         """Return the hashes based on the provided key
@@ -241,12 +257,23 @@ class BloomFilter:
 
         Args:
             hashes (list): A list of integers representing the key to insert"""
-        for i in range(0, self._number_hashes):
-            k = hashes[i] % self._num_bits
-            idx = k // 8
-            self._bloom[idx] = self._bloom[idx] | (1 << (k % 8))
+        bloom = self._bloom
+        num_bits = self._num_bits
+        for i in range(self._number_hashes):
+            k = hashes[i] % num_bits
+            bloom[k >> 3] |= _BIT_MASKS[k & 7]
         self._els_added += 1
 
+    def add_many(self, keys: Iterable[KeyT]) -> None:
+        """Add each of the keys to the Bloom Filter
+
+        Args:
+            keys (iterable): The elements to be inserted"""
+        hashes = self.hashes
+        add_alt = self.add_alt
+        for key in keys:
+            add_alt(hashes(key))
+
     def check(self, key: KeyT) -> bool:
         """Check if the key is likely in the Bloom Filter
 
@@ -263,12 +290,25 @@ class BloomFilter:
             hashes (list): A list of integers representing the key to check
         Returns:
             bool: True if likely encountered, False if definately not"""
+        bloom = self._bloom
+        num_bits = self._num_bits
         for i in range(self._number_hashes):
-            k = hashes[i] % self._num_bits
-            if (self._bloom[k // 8] & (1 << (k % 8))) == 0:
+            k = hashes[i] % num_bits
+            if not bloom[k >> 3] & _BIT_MASKS[k & 7]:
                 return False
         return True
 
+    def check_many(self, keys: Iterable[KeyT]) -> List[bool]:
+        """Check if each of the keys is likely in the Bloom Filter
+
+        Args:
+            keys (iterable): The elements to be checked
+        Returns:
+            list(bool): For each key, True if likely encountered, False if definately not"""
+        hashes = self.hashes
+        check_alt = self.check_alt
+        return [check_alt(hashes(key)) for key in keys]
+
     def export_hex(self) -> str:
         """Export the Bloom Filter as a hex string
 
@@ -279,8 +319,8 @@ class BloomFilter:
             self.elements_added,
             self.false_positive_rate,
         )
-        bytes_string = hexlify(bytearray(self._bloom[: self.bloom_length])) + hexlify(footer_bytes)
-        return str(bytes_string, "utf-8")
+        with memoryview(self._bloom) as view:
+            return view[: self._bloom_length].hex() + footer_bytes.hex()
 
     def export(self, file: Union[Path, str, IOBase, mmap]) -> None:
         """Export the Bloom Filter to disk
@@ -292,7 +332,7 @@ class BloomFilter:
             with open(file, "wb") as filepointer:
                 self.export(filepointer)
         else:
-            self._bloom.tofile(file)  # type: ignore
+            file.write(self._bloom)  # type: ignore
             file.write(
                 self._FOOTER_STRUCT.pack(
                     self.estimated_elements,
@@ -306,11 +346,10 @@ class BloomFilter:
 
         Args:
             filename (str): The filename to which the Bloom Filter will be written."""
-        data = ("  " + line for line in wrap(", ".join(f"0x{e:02x}" for e in bytearray.fromhex(self.export_hex())), 80))
-        if self._type in ["regular", "regular-on-disk"]:
-            bloom_type = "standard BloomFilter"
-        else:
-            bloom_type = "CountingBloomFilter"
+        data = [_C_HEX_BYTES[e] for e in bytes.fromhex(self.export_hex())]
+        per_line = _C_HEX_BYTES_PER_LINE
+        lines = ",\n  ".join(", ".join(data[i : i + per_line]) for i in range(0, len(data), per_line))
+        bloom_type = _C_HEADER_BLOOM_TYPES[self._type]
 
         with open(filename, "w", encoding="utf-8") as file:
             print(f"/* BloomFilter Export of a {bloom_type} */", file=file)
@@ -320,7 +359,7 @@ class BloomFilter:
             print("const float false_positive_rate = ", self.false_positive_rate, ";", sep="", file=file)
             print("const uint64_t number_bits = ", self.number_bits, ";", sep="", file=file)
             print("const unsigned int number_hashes = ", self.number_hashes, ";", sep="", file=file)
-            print("const unsigned char bloom[] = {", *data, "};", sep="\n", file=file)
+            print("const unsigned char bloom[] = {", "  " + lines, "};", sep="\n", file=file)
 
     @classmethod
     def frombytes(cls, b: ByteString, hash_function: Union[HashFuncT, None] = None) -> "BloomFilter":
@@ -333,7 +372,7 @@ class BloomFilter:
         """
         offset = cls._FOOTER_STRUCT.size
         est_els, els_added, fpr, _, _ = cls._parse_footer(cls._FOOTER_STRUCT, bytes(b[-1 * offset :]))
-        blm = BloomFilter(est_elements=est_els, false_positive_rate=fpr, hash_function=hash_function)
+        blm = cls(est_elements=est_els, false_positive_rate=fpr, hash_function=hash_function)
         blm._load(b, hash_function=blm.hash_function)
         blm._els_added = els_added
         return blm
@@ -378,25 +417,20 @@ class BloomFilter:
         Returns:
             BloomFilter: The new Bloom Filter containing the intersection
         Raises:
-            TypeError: When second is not either a :class:`BloomFilter` or :class:`BloomFilterOnDisk`
+            TypeError: When second is not either a :class:`BloomFilter` or :class:`BloomFilterOnDisk` \
+                with the same bit layout
         Note:
             `second` may be a BloomFilterOnDisk object
         Note:
             If `second` is not of the same size (false_positive_rate and est_elements) then this will return `None`"""
-        if not _verify_not_type_mismatch(second):
+        if not _verify_not_type_mismatch(self, second):
             raise TypeError(MISMATCH_MSG)
 
         if self._verify_bloom_similarity(second) is False:
             return None
 
-        res = BloomFilter(
-            self.estimated_elements,
-            self.false_positive_rate,
-            hash_function=self.hash_function,
-        )
-
-        for i in range(0, res.bloom_length):
-            res._bloom[i] = self._get_element(i) & second._get_element(i)
+        res = self._new_empty()
+        res._bloom_from_int(self._bloom_to_int() & second._bloom_to_int())
         res.elements_added = res.estimate_elements()
         return res
 
@@ -408,25 +442,20 @@ class BloomFilter:
         Returns:
             BloomFilter: The new Bloom Filter containing the union
         Raises:
-            TypeError: When second is not either a :class:`BloomFilter` or :class:`BloomFilterOnDisk`
+            TypeError: When second is not either a :class:`BloomFilter` or :class:`BloomFilterOnDisk` \
+                with the same bit layout
         Note:
             `second` may be a BloomFilterOnDisk object
         Note:
             If `second` is not of the same size (false_positive_rate and est_elements) then this will return `None`"""
-        if not _verify_not_type_mismatch(second):
+        if not _verify_not_type_mismatch(self, second):
             raise TypeError(MISMATCH_MSG)
 
         if self._verify_bloom_similarity(second) is False:
             return None
 
-        res = BloomFilter(
-            self.estimated_elements,
-            self.false_positive_rate,
-            hash_function=self.hash_function,
-        )
-
-        for i in range(self.bloom_length):
-            res._bloom[i] = self._get_element(i) | second._get_element(i)
+        res = self._new_empty()
+        res._bloom_from_int(self._bloom_to_int() | second._bloom_to_int())
         res.elements_added = res.estimate_elements()
         return res
 
@@ -438,27 +467,22 @@ class BloomFilter:
         Returns:
             float: A numeric value between 0 and 1 where 1 is identical and 0 means completely different
         Raises:
-            TypeError: When second is not either a :class:`BloomFilter` or :class:`BloomFilterOnDisk`
+            TypeError: When second is not either a :class:`BloomFilter` or :class:`BloomFilterOnDisk` \
+                with the same bit layout
         Note:
             `second` may be a BloomFilterOnDisk object
         Note:
             If `second` is not of the same size (false_positive_rate and est_elements) then this will return `None`"""
-        if not _verify_not_type_mismatch(second):
+        if not _verify_not_type_mismatch(self, second):
             raise TypeError(MISMATCH_MSG)
 
         if self._verify_bloom_similarity(second) is False:
             return None
 
-        count_union = 0
-
-        count_int = 0
-        for i in range(0, self.bloom_length):
-            el1 = self._get_element(i)
-            el2 = second._get_element(i)
-            t_union = el1 | el2
-            t_intersection = el1 & el2
-            count_union += bin(t_union).count("1")
-            count_int += bin(t_intersection).count("1")
+        el1 = self._bloom_to_int()
+        el2 = second._bloom_to_int()
+        count_union = popcount_int(el1 | el2)
+        count_int = popcount_int(el1 & el2)
         if count_union == 0:
             return 1.0
         return count_int / count_union
@@ -474,12 +498,17 @@ class BloomFilter:
         if not valid_prms:
             msg = "Bloom: false positive rate must be between 0.0 and 1.0"
             raise InitializationError(msg)
+        return cls._calc_optimized_params(estimated_elements, false_positive_rate)
 
+    @classmethod
+    @lru_cache(maxsize=128)
+    def _calc_optimized_params(cls, estimated_elements: int, false_positive_rate: float) -> Tuple[float, int, int]:
+        """calculate the optimal parameters; cached as many filters are often built with the same parameters"""
         fpr = cls._FPR_STRUCT.pack(float(false_positive_rate))
         t_fpr = float(cls._FPR_STRUCT.unpack(fpr)[0])  # to mimic the c version!
         # optimal caluclations
-        m_bt = math.ceil((-estimated_elements * math.log(t_fpr)) / 0.4804530139182)  # ln(2)^2
-        number_hashes = int(round(0.6931471805599453 * m_bt / estimated_elements))  # math.log(2.0)
+        m_bt = math.ceil((-estimated_elements * math.log(t_fpr)) / LN_2_SQUARED)
+        number_hashes = int(round(LN_2 * m_bt / estimated_elements))
 
         if number_hashes == 0:
             raise InitializationError("Bloom: Number hashes is zero; unusable parameters provided")
@@ -496,7 +525,7 @@ class BloomFilter:
     ) -> None:
         self._est_elements = est_els
         self._fpr = fpr
-        self._bloom_length = math.ceil(n_bits / self._bits_per_elm)
+        self._bloom_length = (n_bits + self._bits_per_elm - 1) // self._bits_per_elm
         if hash_func is not None:
             self._hash_func = hash_func
         else:
@@ -507,12 +536,11 @@ class BloomFilter:
 
     def _load_hex(self, hex_string: str, hash_function: Union[HashFuncT, None] = None) -> None:
         """placeholder for loading from hex string"""
-        offset = self._FOOTER_STRUCT_BE.size * 2
-        est_els, els_added, fpr, n_hashes, n_bits = self._parse_footer(
-            self._FOOTER_STRUCT_BE, unhexlify(hex_string[-offset:])
-        )
+        offset = self._FOOTER_STRUCT_BE.size
+        raw = bytes.fromhex(hex_string)
+        est_els, els_added, fpr, n_hashes, n_bits = self._parse_footer(self._FOOTER_STRUCT_BE, raw[-offset:])
         self._set_values(est_els, fpr, n_hashes, n_bits, hash_function)
-        self._bloom = array(self._typecode, unhexlify(hex_string[:-offset]))
+        self._parse_bloom_array(raw, len(raw) - offset)
         self._els_added = els_added
 
     def _load(
@@ -539,7 +567,7 @@ class BloomFilter:
     def _parse_footer(cls, stct: Struct, d: ByteString) -> Tuple[int, int, float, int, int]:
         """parse footer returning the data: estimated elements, elements added,
         false positive rate, hash function, number hashes, number bits"""
-        e_elms, e_added, fpr = stct.unpack_from(bytearray(d))
+        e_elms, e_added, fpr = stct.unpack_from(d)
 
         est_elements = e_elms
         els_added = e_added
@@ -550,14 +578,26 @@ class BloomFilter:
 
     def _parse_bloom_array(self, b: ByteString, offset: int) -> None:
         """parse bytes into the bloom array"""
-        self._bloom = array(self._typecode, bytes(b[:offset]))
+        self._bloom = array(self._typecode)
+        with memoryview(b) as view:
+            self._bloom.frombytes(view[:offset])
 
     def _cnt_number_bits_set(self) -> int:
         """calculate the total number of set bits in the bloom"""
-        setbits = 0
-        for i in range(0, self.bloom_length):
-            setbits += bin(self._bloom[i]).count("1")
-        return setbits
+        return popcount(bytes(self._bloom[: self._bloom_length]))
+
+    def _bloom_to_int(self) -> int:
+        """the bit array as a single integer; used for whole filter bitwise operations on `B` arrays"""
+        return int.from_bytes(bytes(self._bloom[: self._bloom_length]), "big")
+
+    def _bloom_from_int(self, val: int) -> None:
+        """set the bit array from a single integer; the inverse of `_bloom_to_int`"""
+        self._bloom = array(self._typecode, val.to_bytes(self._bloom_length, "big"))
+
+    def _new_empty(self) -> "BloomFilter":
+        """create an empty, in memory, Bloom Filter of the same type and size to hold a result"""
+        blm_type = BloomFilter if self.is_on_disk else type(self)
+        return blm_type(self.estimated_elements, self.false_positive_rate, hash_function=self.hash_function)
 
     def _get_element(self, idx: int) -> int:
         """wrappper for getting an element from the Bloom Filter!"""
@@ -565,12 +605,10 @@ class BloomFilter:
 
     def _verify_bloom_similarity(self, second: SimpleBloomT) -> bool:
         """can the blooms be used in intersection, union, or jaccard index"""
-        hash_match = self.number_hashes != second.number_hashes
-        same_bits = self.number_bits != second.number_bits
-        next_hash = self.hashes("test") != second.hashes("test")
-        if hash_match or same_bits or next_hash:
+        if self.number_hashes != second.number_hashes or self.number_bits != second.number_bits:
             return False
-        return True
+        # only hash when the sizes match; it is the most expensive check
+        return self.hashes("test") == second.hashes("test")
 
 
 class BloomFilterOnDisk(BloomFilter):
@@ -622,7 +660,7 @@ class BloomFilterOnDisk(BloomFilter):
             self._set_values(est_elements, fpr, n_hashes, n_bits, hash_function)
 
             with open(self._filepath, "wb") as filepointer:
-                (array(self._typecode, [0]) * self.bloom_length).tofile(filepointer)
+                filepointer.write(bytes(self.bloom_length * self._IMPT_STRUCT.size))
                 filepointer.write(self._FOOTER_STRUCT.pack(est_elements, 0, false_positive_rate))
                 filepointer.flush()
             self._load(self._filepath, hash_function)
@@ -646,6 +684,12 @@ class BloomFilterOnDisk(BloomFilter):
             self.__file_pointer.close()
             self.__file_pointer = None
 
+    def clear(self) -> None:
+        """Clear or reset the Bloom Filter on disk"""
+        self._els_added = 0
+        self._bloom[: self._bloom_length] = bytes(self._bloom_length)
+        self.__update()
+
     def export(self, file: Union[str, Path]) -> None:  # type: ignore
         """Export to disk if a different location
 
@@ -679,6 +723,17 @@ class BloomFilterOnDisk(BloomFilter):
         super().add_alt(hashes)
         self.__update()
 
+    def add_many(self, keys: Iterable[KeyT]) -> None:
+        """Add each of the keys to the Bloom Filter, updating the file once
+
+        Args:
+            keys (iterable): The elements to be inserted"""
+        hashes = self.hashes
+        add_alt = super().add_alt
+        for key in keys:
+            add_alt(hashes(key))
+        self.__update()
+
     @classmethod
     def frombytes(cls, b: ByteString, hash_function: Union[HashFuncT, None] = None) -> "BloomFilterOnDisk":
         """
@@ -690,10 +745,6 @@ class BloomFilterOnDisk(BloomFilter):
     _EXPECTED_ELM_STRUCT = Struct("Q")
     _UPDATE_OFFSET = Struct("Qf")
 
-    def _get_element(self, idx: int) -> int:
-        """wrappper to use similar functions always!"""
-        return int(self._IMPT_STRUCT.unpack(bytes([self._bloom[idx]]))[0])
-
     def __update(self):
         """update the on disk Bloom Filter and ensure everything is out to disk"""
         self._bloom.flush()
@@ -6,7 +6,7 @@
 from array import array
 from pathlib import Path
 from struct import Struct
-from typing import ByteString, Union
+from typing import ByteString, Iterable, List, Union
 
 from probables.blooms.bloom import BloomFilter
 from probables.constants import UINT32_T_MAX, UINT64_T_MAX
@@ -58,7 +58,7 @@ class CountingBloomFilter(BloomFilter):
 
     def _load_init(self, filepath, hash_function, hex_string, est_elements, false_positive_rate):
         """Handle setting params and loading everything as needed"""
-        self._bits_per_elm = 1.0
+        self._bits_per_elm = 1
         self._type = "counting"
         self._typecode = "I"
 
@@ -141,15 +141,16 @@ class CountingBloomFilter(BloomFilter):
             int: Maximum number of insertions"""
         # NOTE: this will increment indices each time it is viewed. Not sure if that is "correct"
         #       if not then we will need to update this and the C version
-        indices = [hashes[i] % self._bloom_length for i in range(self._number_hashes)]
-        vals = [self._bloom[k] + num_els for k in indices]
+        bloom = self._bloom
+        indices = self._get_indices(hashes)
+        vals = [bloom[k] + num_els for k in indices]
         for i, v in enumerate(vals):
             k = indices[i]
             if v > UINT32_T_MAX:
-                self._bloom[k] = UINT32_T_MAX
+                bloom[k] = UINT32_T_MAX
                 vals[i] = UINT32_T_MAX
             else:
-                self._bloom[k] += num_els  # This keeps the original methodology
+                bloom[k] += num_els  # This keeps the original methodology
         self.elements_added = min(self.elements_added + num_els, UINT64_T_MAX)
         return min(vals)
 
@@ -170,7 +171,18 @@ class CountingBloomFilter(BloomFilter):
             hashes (list): A list of integers representing the key to check
         Returns:
             int: Maximum number of insertions"""
-        return min(self._bloom[x % self.number_bits] for x in hashes)
+        return min(map(self._bloom.__getitem__, self._get_indices(hashes)))
+
+    def check_many(self, keys: Iterable[KeyT]) -> List[int]:  # type: ignore
+        """Check each of the keys in the Counting Bloom Filter
+
+        Args:
+            keys (iterable): The elements to be checked
+        Returns:
+            list(int): For each key, the maximum number of insertions"""
+        hashes = self.hashes
+        check_alt = self.check_alt
+        return [check_alt(hashes(key)) for key in keys]
 
     def remove(self, key: KeyT, num_els: int = 1) -> int:
         """Remove the element from the counting bloom
@@ -191,8 +203,9 @@ class CountingBloomFilter(BloomFilter):
         Returns:
             int: Maximum number of insertions after the removal"""
 
-        indices = [hashes[i] % self._bloom_length for i in range(self._number_hashes)]
-        vals = [self._bloom[k] for k in indices]
+        bloom = self._bloom
+        indices = self._get_indices(hashes)
+        vals = [bloom[k] for k in indices]
         min_val = min(vals)
         if min_val == UINT32_T_MAX:  # cannot remove if we have hit the max
             return UINT32_T_MAX
@@ -201,8 +214,8 @@ class CountingBloomFilter(BloomFilter):
 
         to_remove = num_els if min_val > num_els else min_val
         for k in indices:
-            if self._bloom[k] < UINT32_T_MAX:  # only remove if less than UINT32_T_MAX
-                self._bloom[k] -= to_remove
+            if bloom[k] < UINT32_T_MAX:  # only remove if less than UINT32_T_MAX
+                bloom[k] -= to_remove
         self.elements_added -= to_remove
         return min_val - to_remove
 
@@ -300,6 +313,11 @@ class CountingBloomFilter(BloomFilter):
         res.elements_added = res.estimate_elements()
         return res
 
+    def _get_indices(self, hashes: HashResultsT) -> List[int]:
+        """map the hashes to their counter positions in a single pass"""
+        length = self._bloom_length
+        return [h % length for h in hashes[: self._number_hashes]]
+
     def _cnt_number_bits_set(self) -> int:
         """calculate the total number of set bits in the bloom"""
-        return sum(1 for x in self._bloom if x > 0)
+        return self._bloom_length - self._bloom.count(0)
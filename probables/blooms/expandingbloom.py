@@ -9,7 +9,7 @@ from io import BytesIO, IOBase
 from mmap import mmap
 from pathlib import Path
 from struct import Struct
-from typing import ByteString, Tuple, Union
+from typing import ByteString, Iterable, List, Tuple, Union
 
 from probables.blooms.bloom import BloomFilter
 from probables.exceptions import RotatingBloomFilterError
@@ -149,6 +149,17 @@ class ExpandingBloomFilter:
                 return True
         return False
 
+    def check_many(self, keys: Iterable[KeyT]) -> List[bool]:
+        """Check if each of the keys is likely in the Bloom Filter
+
+        Args:
+            keys (iterable): The keys to check for in the Bloom Filter
+        Returns:
+            list(bool): For each key, `True` if the element is likely present; `False` if definately not present"""
+        hashes = self._blooms[0].hashes
+        check_alt = self.check_alt
+        return [check_alt(hashes(key)) for key in keys]
+
     def add(self, key: KeyT, force: bool = False) -> None:
         """Add the key to the Bloom Filter
 
@@ -171,6 +182,18 @@ class ExpandingBloomFilter:
             self.__check_for_growth()
             self._blooms[-1].add_alt(hashes)
 
+    def add_many(self, keys: Iterable[KeyT], force: bool = False) -> None:
+        """Add each of the keys to the Bloom Filter
+
+        Args:
+            keys (iterable): The elements to be inserted
+            force (bool): `True` will force them to be inserted, even if likely inserted \
+                before `False` will only insert those not found in the Bloom Filter"""
+        hashes = self._blooms[0].hashes
+        add_alt = self.add_alt
+        for key in keys:
+            add_alt(hashes(key), force)
+
     def __add_bloom_filter(self):
         """build a new bloom and add it on!"""
         blm = BloomFilter(
@@ -199,7 +222,7 @@ class ExpandingBloomFilter:
             # add all the different Bloom bit arrays...
             for blm in self._blooms:
                 filepointer.write(self.__S_INT64_STRUCT.pack(blm.elements_added))
-                blm.bloom.tofile(filepointer)
+                filepointer.write(blm.bloom)
             filepointer.write(
                 self.__FOOTER_STRUCT.pack(
                     len(self._blooms),
@@ -235,19 +258,21 @@ class ExpandingBloomFilter:
         blm_size = 0
         start = 0
         end = 0
-        for _ in range(size):
-            blm = BloomFilter(
-                est_elements=self.__est_elements,
-                false_positive_rate=self.__fpr,
-                hash_function=self.__hash_func,
-            )
-            if blm_size == 0:
-                blm_size = self._BLOOM_ELEMENT_SIZE * blm.bloom_length
-            end = start + self.__S_INT64_STRUCT.size + blm_size
-            blm._els_added = int(self.__S_INT64_STRUCT.unpack(bytes(b[start : start + self.__S_INT64_STRUCT.size]))[0])
-            blm._bloom = array("B", bytes(b[start + self.__S_INT64_STRUCT.size : end]))
-            self._blooms.append(blm)
-            start = end
+        with memoryview(b) as view:
+            for _ in range(size):
+                blm = BloomFilter(
+                    est_elements=self.__est_elements,
+                    false_positive_rate=self.__fpr,
+                    hash_function=self.__hash_func,
+                )
+                if blm_size == 0:
+                    blm_size = self._BLOOM_ELEMENT_SIZE * blm.bloom_length
+                end = start + self.__S_INT64_STRUCT.size + blm_size
+                blm._els_added = int(self.__S_INT64_STRUCT.unpack_from(view, start)[0])
+                blm._bloom = array("B")
+                blm._bloom.frombytes(view[start + self.__S_INT64_STRUCT.size : end])
+                self._blooms.append(blm)
+                start = end
 
 
 class RotatingBloomFilter(ExpandingBloomFilter):
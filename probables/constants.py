@@ -5,3 +5,5 @@ INT64_T_MIN = -9223372036854775808
 INT64_T_MAX = 9223372036854775807
 UINT32_T_MAX = 2**32 - 1
 UINT64_T_MAX = 2**64 - 1
+LN_2 = 0.6931471805599453  # math.log(2.0)
+LN_2_SQUARED = 0.4804530139182  # math.log(2.0) ** 2; precision matches the C implementations
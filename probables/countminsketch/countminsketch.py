@@ -13,7 +13,7 @@ from pathlib import Path
 from struct import Struct
 from typing import ByteString, Dict, Tuple, Union
 
-from probables.constants import INT32_T_MAX, INT32_T_MIN, INT64_T_MAX, INT64_T_MIN
+from probables.constants import INT32_T_MAX, INT32_T_MIN, INT64_T_MAX, INT64_T_MIN, LN_2
 from probables.exceptions import CountMinSketchError, InitializationError, NotSupportedError
 from probables.hashes import HashFuncT, HashResultsT, KeyT, default_fnv_1a
 from probables.utilities import MMap, is_valid_file, resolve_path
@@ -101,7 +101,7 @@ class CountMinSketch:
                 self.__error_rate = error_rate
                 self.__width = math.ceil(2 / error_rate)
                 numerator = -1 * math.log(1 - confidence)
-                self.__depth = math.ceil(numerator / 0.6931471805599453)
+                self.__depth = math.ceil(numerator / LN_2)
 
             else:
                 msg = (
@@ -240,8 +240,7 @@ class CountMinSketch:
     def clear(self) -> None:
         """Reset the count-min sketch to an empty state"""
         self.__elements_added = 0
-        for i, _ in enumerate(self._bins):
-            self._bins[i] = 0
+        self._bins[:] = array("i", [0]) * len(self._bins)
 
     def hashes(self, key: KeyT, depth: Union[int, None] = None) -> HashResultsT:
         """Return the hashes based on the provided key
@@ -272,16 +271,18 @@ class CountMinSketch:
             num_els (int): The number of times to insert the element
         Returns:
             int: The number of times the element was likely inserted after the insertion"""
-        bins = [(val % self.width) + (i * self.width) for i, val in enumerate(hashes)]
-        vals = [self._bins[x] + num_els for x in bins]
+        width = self.__width
+        table = self._bins
+        bins = [(val % width) + (i * width) for i, val in enumerate(hashes)]
+        vals = [table[x] + num_els for x in bins]
 
         for i, val in enumerate(vals):
             idx = bins[i]
             if val > INT32_T_MAX:
-                self._bins[idx] = INT32_T_MAX
+                table[idx] = INT32_T_MAX
                 vals[i] = INT32_T_MAX
             else:
-                self._bins[idx] = val
+                table[idx] = val
         self.__elements_added += num_els
         if self.elements_added > INT64_T_MAX:
             self.__elements_added = INT64_T_MAX
@@ -305,14 +306,16 @@ class CountMinSketch:
             num_els (int): The number of times to remove the element
         Returns:
             int: The number of times the element was likely inserted after the removal"""
-        bins = [(v % self.width) + (i * self.width) for i, v in enumerate(hashes)]
-        vals = [self._bins[x] - num_els for x in bins]
+        width = self.__width
+        table = self._bins
+        bins = [(v % width) + (i * width) for i, v in enumerate(hashes)]
+        vals = [table[x] - num_els for x in bins]
         for i, val in enumerate(vals):
             idx = bins[i]
             if val > INT32_T_MIN:
-                self._bins[idx] = val
+                table[idx] = val
             else:
-                self._bins[idx] = INT32_T_MIN
+                table[idx] = INT32_T_MIN
                 vals[i] = INT32_T_MIN
         self.__elements_added -= num_els
         if self.elements_added < INT64_T_MIN:
@@ -336,8 +339,9 @@ class CountMinSketch:
             hashes (list): The hashes representing the element to check
         Returns:
             int: The number of times the element was likely inserted"""
-        bins = [(val % self.width) + (i * self.width) for i, val in enumerate(hashes)]
-        return self.__query_method(sorted([self._bins[i] for i in bins]))
+        width = self.__width
+        table = self._bins
+        return self.__query_method(sorted([table[(val % width) + (i * width)] for i, val in enumerate(hashes)]))
 
     def export(self, file: Union[Path, str, IOBase, mmap]) -> None:
         """Export the count-min sketch to disk
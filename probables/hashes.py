@@ -67,6 +67,34 @@ def hash_with_depth_int(func: HashFuncT) -> HashFuncT:
     return hashing_func
 
 
+def hash_with_double_hashing(func: SimpleHashT) -> HashFuncT:
+    """Decorator to turn a function that takes a key and a seed and hashes it
+    to a 64 bit int into a double hashing strategy; the key is only hashed
+    twice (seeds 0 and 1) and the remaining hashes are derived as
+    `h1 + i * h2` (Kirsch-Mitzenmacher) with `h2` forced to be odd. Wraps
+    functions to be used in Bloom filters and Count-Min sketch data structures.
+
+    Args:
+        key (str): The element to be hashed
+        depth (int): The number of hash permutations to compute
+    Returns:
+        list(int): 64-bit hashed representation of key
+    Note:
+        Arguments shown are as it will be after decorated"""
+
+    @wraps(func)
+    def hashing_func(key, depth=1):
+        """wrapper function"""
+        h1 = func(key, 0)
+        if depth == 1:
+            return [h1]
+        h2 = func(key, 1) | 1  # odd so the derived hashes never collapse to h1
+        max64 = UINT64_T_MAX
+        return [(h1 + idx * h2) & max64 for idx in range(depth)]
+
+    return hashing_func
+
+
 def default_fnv_1a(key: KeyT, depth: int = 1) -> List[int]:
     """The default fnv-1a hashing routine
 
@@ -76,10 +104,23 @@ def default_fnv_1a(key: KeyT, depth: int = 1) -> List[int]:
     Returns:
         list(int): List of size depth hashes"""
 
-    res = []
-    for idx in range(depth):
-        res.append(fnv_1a(key, idx))
-    return res
+    return [fnv_1a(key, idx) for idx in range(depth)]
+
+
+@hash_with_double_hashing
+def default_fnv_1a_double(key: KeyT, seed: int = 0) -> int:
+    """Double hashing variant of the fnv-1a hashing routine; only two fnv-1a
+    hashes are computed and the remaining are derived from them
+
+    Args:
+        key (str): The element to be hashed
+        depth (int): The number of hash permutations to compute
+    Returns:
+        list(int): List of size depth hashes
+    Note:
+        Not interchangeable with `default_fnv_1a`; structures exported using one \
+            cannot be loaded using the other"""
+    return fnv_1a(key, seed)
 
 
 def fnv_1a(key: KeyT, seed: int = 0) -> int:
@@ -92,13 +133,12 @@ def fnv_1a(key: KeyT, seed: int = 0) -> int:
         int: 64-bit hashed representation of key
     Note:
         Uses the lower 64 bits when overflows occur"""
-    hval = (14695981039346656037 + (31 * seed)) & UINT64_T_MAX
+    max64 = UINT64_T_MAX
+    hval = (14695981039346656037 + (31 * seed)) & max64
     fnv_64_prime = 1099511628211
-    tmp = list(key) if not isinstance(key, str) else list(map(ord, key))
+    tmp = key if not isinstance(key, str) else map(ord, key)
     for t_str in tmp:
-        hval ^= t_str
-        hval *= fnv_64_prime
-        hval &= UINT64_T_MAX
+        hval = ((hval ^ t_str) * fnv_64_prime) & max64
     return hval
 
 
@@ -111,13 +151,12 @@ def fnv_1a_32(key: KeyT, seed: int = 0) -> int:
         int: 32-bit hashed representation of key
     Note:
         Uses the lower 32 bits when overflows occur"""
-    hval = (0x811C9DC5 + (31 * seed)) & UINT32_T_MAX
+    max32 = UINT32_T_MAX
+    hval = (0x811C9DC5 + (31 * seed)) & max32
     fnv_32_prime = 0x01000193
-    tmp = list(key) if not isinstance(key, str) else list(map(ord, key))
+    tmp = key if not isinstance(key, str) else map(ord, key)
     for t_str in tmp:
-        hval ^= t_str
-        hval *= fnv_32_prime
-        hval &= UINT32_T_MAX
+        hval = ((hval ^ t_str) * fnv_32_prime) & max32
     return hval
 
 
@@ -1,11 +1,15 @@
 """ Utility Functions """
 
-import math
 import mmap
 import string
 from array import array
 from pathlib import Path
-from typing import Union
+from typing import ByteString, Union
+
+# number of set bits for each possible byte value; used with `bytes.translate`
+_POPCOUNT_TABLE = bytes(bin(i).count("1") for i in range(256))
+# `int.bit_count` is only available in python 3.10+
+_HAS_BIT_COUNT = hasattr(int, "bit_count")
 
 
 def is_hex_string(hex_string: Union[str, None]) -> bool:
@@ -34,6 +38,20 @@ def get_x_bits(num: int, max_bits: int, num_bits: int, right_bits: bool = True)
     return ((1 << num_bits) - 1) & (num >> (max_bits - num_bits))
 
 
+def popcount(data: ByteString) -> int:
+    """count the number of bits set in the passed in bytes"""
+    if _HAS_BIT_COUNT:
+        return int.from_bytes(data, "big").bit_count()  # type: ignore
+    return sum(bytes(data).translate(_POPCOUNT_TABLE))
+
+
+def popcount_int(val: int) -> int:
+    """count the number of bits set in the passed in non-negative integer"""
+    if _HAS_BIT_COUNT:
+        return val.bit_count()  # type: ignore
+    return popcount(val.to_bytes((val.bit_length() + 7) // 8, "big"))
+
+
 class MMap:
     """Simplified mmap.mmap class"""
 
@@ -99,7 +117,7 @@ class Bitarray:
             raise TypeError(f"Bitarray size must be an int; {type(size)} was provided")
         if size <= 0:
             raise ValueError(f"Bitarray size must be larger than 1; {size} was provided")
-        self._size_bytes = math.ceil(size / 8)
+        self._size_bytes = (size + 7) // 8
         self._bitarray = array("B", [0]) * self._size_bytes
         self._size = size
 
@@ -174,8 +192,7 @@ class Bitarray:
 
     def clear(self):
         """Clear all bits in the bitarray"""
-        for i in range(self._size_bytes):
-            self._bitarray[i] = 0
+        self._bitarray[:] = array("B", [0]) * self._size_bytes
 
     def as_string(self):
         """String representation of the bitarray
@@ -189,4 +206,4 @@ class Bitarray:
 
         Returns:
             int: Number of bits set"""
-        return sum(self.check_bit(x) for x in range(self._size))
+        return popcount(self._bitarray)
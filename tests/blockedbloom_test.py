@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+""" Unittest class """
+
+import hashlib
+import os
+import sys
+import unittest
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+
+this_dir = Path(__file__).parent
+sys.path.insert(0, str(this_dir))
+sys.path.insert(0, str(this_dir.parent))
+
+from probables import BlockedBloomFilter, BloomFilter
+from probables.exceptions import InitializationError
+from tests.utilities import calc_file_md5, different_hash
+
+DELETE_TEMP_FILES = True
+
+
+class TestBlockedBloomFilter(unittest.TestCase):
+    """Test the blocked bloom filter implementation"""
+
+    def test_bbf_init(self):
+        """test the initialization of the blocked bloom filter"""
+        blm = BlockedBloomFilter(est_elements=10, false_positive_rate=0.05)
+        self.assertEqual(blm.false_positive_rate, 0.05000000074505806)
+        self.assertEqual(blm.estimated_elements, 10)
+        self.assertEqual(blm.number_hashes, 4)
+        self.assertEqual(blm.number_bits, 512)
+        self.assertEqual(blm.number_blocks, 1)
+        self.assertEqual(blm.elements_added, 0)
+        self.assertEqual(blm.is_on_disk, False)
+        self.assertEqual(blm.bloom_length, 64)
+
+    def test_bbf_init_rounding(self):
+        """test that the number of bits is rounded up to whole blocks"""
+        blm = BlockedBloomFilter(est_elements=1000, false_positive_rate=0.01)
+        bloom = BloomFilter(est_elements=1000, false_positive_rate=0.01)
+        self.assertEqual(blm.number_hashes, bloom.number_hashes)
+        self.assertEqual(blm.number_blocks, 19)
+        self.assertEqual(blm.number_bits, 19 * 512)
+        self.assertGreaterEqual(blm.number_bits, bloom.number_bits)
+        self.assertEqual(blm.bloom_length, 19 * 64)
+
+    def test_bbf_add_check(self):
+        """ensure adding and checking the blocked bloom filter works"""
+        blm = BlockedBloomFilter(est_elements=10, false_positive_rate=0.05)
+        blm.add("this is a test")
+        blm.add("this is another test")
+        self.assertEqual(blm.elements_added, 2)
+        self.assertEqual(blm.check("this is a test"), True)
+        self.assertEqual(blm.check("this is another test"), True)
+        self.assertEqual(blm.check("this is yet another test"), False)
+        self.assertEqual("this is not another test" in blm, False)
+
+    def test_bbf_single_block(self):
+        """ensure all bits for an element are set within a single block"""
+        blm = BlockedBloomFilter(est_elements=1000, false_positive_rate=0.01)
+        blm.add("this is a test")
+        blocks = {idx // 64 for idx in range(blm.bloom_length) if blm.bloom[idx]}
+        self.assertEqual(len(blocks), 1)
+
+    def test_bbf_false_positive_rate(self):
+        """ensure the false positive rate is close to the desired rate"""
+        blm = BlockedBloomFilter(est_elements=1000, false_positive_rate=0.05)
+        blm.add_many(str(i) for i in range(1000))
+        self.assertEqual(blm.check_many(str(i) for i in range(1000)), [True] * 1000)
+        false_positives = sum(blm.check_many(str(i) for i in range(1000, 3000)))
+        self.assertLess(false_positives / 2000, 0.1)
+
+    def test_bbf_current_false_positive_rate(self):
+        """ensure the false positive rate estimate accounts for the blocked layout"""
+        blm = BlockedBloomFilter(est_elements=1000, false_positive_rate=0.01)
+        self.assertEqual(blm.current_false_positive_rate(), 0.0)
+        blm.add_many(str(i) for i in range(1000))
+        bloom = BloomFilter(est_elements=1000, false_positive_rate=0.01)
+        bloom.add_many(str(i) for i in range(1000))
+        self.assertGreater(blm.current_false_positive_rate(), bloom.current_false_positive_rate())
+        self.assertAlmostEqual(blm.current_false_positive_rate(), 0.0108, places=4)
+        blm.elements_added = 1000000
+        self.assertAlmostEqual(blm.current_false_positive_rate(), 1.0)
+
+    def test_bbf_estimate_elements(self):
+        """test estimating the number of elements added"""
+        blm = BlockedBloomFilter(est_elements=100, false_positive_rate=0.05)
+        for i in range(10):
+            blm.add("this is a test {0}".format(i))
+        self.assertEqual(blm.estimate_elements(), 10)
+
+    def test_bbf_clear(self):
+        """test clearing the blocked bloom filter"""
+        blm = BlockedBloomFilter(est_elements=10, false_positive_rate=0.05)
+        blm.add("this is a test")
+        blm.clear()
+        self.assertEqual(blm.elements_added, 0)
+        self.assertEqual(blm.check("this is a test"), False)
+        self.assertEqual(blm.estimate_elements(), 0)
+
+    def test_bbf_export_hex(self):
+        """test exporting the blocked bloom filter to a hex string"""
+        hex_val = (
+            "0012010080008008000040020000100010010000480000200200220000000900"
+            "0044004024000002010000080088040040200020000100910800000400040000"
+            "000000000000000a000000000000000a3d4ccccd"
+        )
+        blm = BlockedBloomFilter(est_elements=10, false_positive_rate=0.05)
+        for i in range(10):
+            blm.add("this is a test {0}".format(i))
+        self.assertEqual(blm.export_hex(), hex_val)
+
+    def test_bbf_load_hex(self):
+        """test loading the blocked bloom filter from a hex string"""
+        blm = BlockedBloomFilter(est_elements=10, false_positive_rate=0.05)
+        for i in range(10):
+            blm.add("this is a test {0}".format(i))
+        blm2 = BlockedBloomFilter(hex_string=blm.export_hex())
+        self.assertEqual(blm2.number_bits, 512)
+        self.assertEqual(blm2.elements_added, 10)
+        self.assertEqual(blm2.check("this is a test 0"), True)
+        self.assertEqual(blm2.check("this is not a test"), False)
+
+    def test_bbf_export_file(self):
+        """test exporting the blocked bloom filter to file"""
+        md5_val = "29c46091d100e86f4e0d4acbdbc49124"
+        blm = BlockedBloomFilter(est_elements=10, false_positive_rate=0.05)
+        for i in range(10):
+            blm.add("this is a test {0}".format(i))
+        with NamedTemporaryFile(dir=os.getcwd(), suffix=".blm", delete=DELETE_TEMP_FILES) as fobj:
+            blm.export(fobj.name)
+            self.assertEqual(calc_file_md5(fobj.name), md5_val)
+            self.assertEqual(os.path.getsize(fobj.name), blm.export_size())
+
+            blm2 = BlockedBloomFilter(filepath=fobj.name)
+            self.assertEqual(blm2.number_blocks, 1)
+            self.assertEqual(blm2.elements_added, 10)
+            self.assertEqual(blm2.check("this is a test 9"), True)
+            self.assertEqual(blm2.check("this is not a test"), False)
+
+    def test_bbf_frombytes(self):
+        """test loading the blocked bloom filter from bytes"""
+        blm = BlockedBloomFilter(est_elements=10, false_positive_rate=0.05)
+        for i in range(10):
+            blm.add("this is a test {0}".format(i))
+        self.assertEqual(hashlib.md5(bytes(blm)).hexdigest(), "29c46091d100e86f4e0d4acbdbc49124")
+
+        blm2 = BlockedBloomFilter.frombytes(bytes(blm))
+        self.assertIsInstance(blm2, BlockedBloomFilter)
+        self.assertEqual(bytes(blm2), bytes(blm))
+        self.assertEqual(blm2.check("this is a test 3"), True)
+
+    def test_bbf_invalid_params(self):
+        """test that insufficient parameters raise an error"""
+        self.assertRaises(InitializationError, lambda: BlockedBloomFilter(filepath="invalid.blm"))
+
+    def test_bbf_export_c_header(self):
+        """test exporting a c header"""
+        blm = BlockedBloomFilter(est_elements=10, false_positive_rate=0.05)
+        blm.add("this is a test")
+        with NamedTemporaryFile(dir=os.getcwd(), suffix=".blm", delete=DELETE_TEMP_FILES) as fobj:
+            blm.export_c_header(fobj.name)
+            with open(fobj.name, "r") as fobj:
+                data = fobj.readlines()
+        self.assertEqual("/* BloomFilter Export of a BlockedBloomFilter */", data[0].strip())
+
+    def test_bbf_union(self):
+        """test the union of two blocked bloom filters"""
+        blm = BlockedBloomFilter(est_elements=20, false_positive_rate=0.05)
+        blm.add("this is a test")
+        blm.add("this is another test")
+        blm2 = BlockedBloomFilter(est_elements=20, false_positive_rate=0.05)
+        blm2.add("this is yet another test")
+
+        blm3 = blm.union(blm2)
+        self.assertIsInstance(blm3, BlockedBloomFilter)
+        self.assertEqual(blm3.elements_added, 3)
+        self.assertEqual(blm3.check("this is a test"), True)
+        self.assertEqual(blm3.check("this is another test"), True)
+        self.assertEqual(blm3.check("this is yet another test"), True)
+        self.assertEqual(blm3.check("this is not another test"), False)
+
+    def test_bbf_intersection(self):
+        """test the intersection of two blocked bloom filters"""
+        blm = BlockedBloomFilter(est_elements=20, false_positive_rate=0.05)
+        blm.add("this is a test")
+        blm.add("this is another test")
+        blm2 = BlockedBloomFilter(est_elements=20, false_positive_rate=0.05)
+        blm2.add("this is another test")
+        blm2.add("this is yet another test")
+
+        blm3 = blm.intersection(blm2)
+        self.assertIsInstance(blm3, BlockedBloomFilter)
+        self.assertEqual(blm3.elements_added, 1)
+        self.assertEqual(blm3.check("this is a test"), False)
+        self.assertEqual(blm3.check("this is another test"), True)
+        self.assertEqual(blm3.check("this is yet another test"), False)
+
+    def test_bbf_jaccard(self):
+        """test the jaccard index of two blocked bloom filters"""
+        blm = BlockedBloomFilter(est_elements=20, false_positive_rate=0.05)
+        blm.add("this is a test")
+        blm2 = BlockedBloomFilter(est_elements=20, false_positive_rate=0.05)
+        blm2.add("this is a test")
+        self.assertEqual(blm.jaccard_index(blm2), 1.0)
+        blm2.add("this is another test")
+        self.assertLess(blm.jaccard_index(blm2), 1.0)
+
+    def test_bbf_set_ops_diff(self):
+        """ensure blocked bloom filters with different hashes cannot be combined"""
+        blm = BlockedBloomFilter(est_elements=20, false_positive_rate=0.05)
+        blm2 = BlockedBloomFilter(est_elements=20, false_positive_rate=0.05, hash_function=different_hash)
+        self.assertEqual(blm.union(blm2), None)
+        self.assertEqual(blm.intersection(blm2), None)
+        self.assertEqual(blm.jaccard_index(blm2), None)
+
+    def test_bbf_set_ops_type_mismatch(self):
+        """ensure blocked bloom filters cannot be combined with standard bloom filters"""
+        msg = "The parameter second must be of type BlockedBloomFilter"
+        blm = BlockedBloomFilter(est_elements=20, false_positive_rate=0.05)
+        blm2 = BloomFilter(est_elements=20, false_positive_rate=0.05)
+        for func in (blm.union, blm.intersection, blm.jaccard_index):
+            with self.assertRaises(TypeError) as ctx:
+                func(blm2)
+            self.assertEqual(str(ctx.exception), msg)
+
+    def test_bbf_set_ops_type_mismatch_base(self):
+        """ensure standard bloom filters cannot be combined with blocked bloom filters"""
+        msg = "The parameter second must be of type BloomFilter or a BloomFilterOnDisk"
+        blm = BloomFilter(est_elements=267, false_positive_rate=0.01)
+        blm2 = BlockedBloomFilter(est_elements=267, false_positive_rate=0.01)
+        self.assertEqual(blm.number_bits, blm2.number_bits)
+        blm2.add_many(str(i) for i in range(200))
+        for func in (blm.union, blm.intersection, blm.jaccard_index):
+            with self.assertRaises(TypeError) as ctx:
+                func(blm2)
+            self.assertEqual(str(ctx.exception), msg)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,7 +16,7 @@ sys.path.insert(0, str(this_dir.parent))
 from probables import BloomFilter, BloomFilterOnDisk
 from probables.constants import UINT64_T_MAX
 from probables.exceptions import InitializationError, NotSupportedError
-from probables.hashes import hash_with_depth_int
+from probables.hashes import default_fnv_1a_double, hash_with_depth_int
 from tests.utilities import calc_file_md5, different_hash
 
 DELETE_TEMP_FILES = True
@@ -64,6 +64,44 @@ class TestBloomFilter(unittest.TestCase):
         self.assertEqual(blm.check("this is yet another test"), False)
         self.assertEqual(blm.check("this is not another test"), False)
 
+    def test_bf_check_alt_partial(self):
+        """ensure that check_alt requires every bit to be set"""
+        blm = BloomFilter(est_elements=10, false_positive_rate=0.05)
+        hashes = blm.hashes("this is a test")
+        blm.add_alt(hashes)
+        self.assertEqual(blm.check_alt(hashes), True)
+        unset = [i for i in range(blm.number_bits) if blm.check_alt([i] * blm.number_hashes) is False]
+        for pos in range(blm.number_hashes):
+            tmp = list(hashes)
+            tmp[pos] = unset[0]
+            self.assertEqual(blm.check_alt(tmp), False)
+
+    def test_bf_add_many(self):
+        """test adding many elements at once"""
+        blm = BloomFilter(est_elements=10, false_positive_rate=0.05)
+        blm2 = BloomFilter(est_elements=10, false_positive_rate=0.05)
+        keys = ["this is a test", "this is another test", "this is yet another test"]
+        blm.add_many(keys)
+        for key in keys:
+            blm2.add(key)
+        self.assertEqual(blm.elements_added, 3)
+        self.assertEqual(blm.export_hex(), blm2.export_hex())
+
+    def test_bf_double_hashing(self):
+        """test using the double hashing strategy"""
+        blm = BloomFilter(est_elements=10, false_positive_rate=0.05, hash_function=default_fnv_1a_double)
+        blm.add_many(["this is a test", "this is another test"])
+        self.assertEqual(blm.check_many(["this is a test", "this is another test"]), [True, True])
+        self.assertEqual(blm.check("this is yet another test"), False)
+
+    def test_bf_check_many(self):
+        """test checking many elements at once"""
+        blm = BloomFilter(est_elements=10, false_positive_rate=0.05)
+        blm.add_many(["this is a test", "this is another test"])
+        res = blm.check_many(["this is a test", "this is not another test", "this is another test"])
+        self.assertEqual(res, [True, False, True])
+        self.assertEqual(blm.check_many([]), [])
+
     def test_bf_in_check(self):
         """check that the in construct works"""
         blm = BloomFilter(est_elements=10, false_positive_rate=0.05)
@@ -627,6 +665,19 @@ class TestBloomFilterOnDisk(unittest.TestCase):
             self.assertEqual(blm.check("this is not another test"), False)
             blm.close()
 
+    def test_bfod_add_many(self):
+        """ensure adding many elements updates the on disk bloom"""
+        with NamedTemporaryFile(dir=os.getcwd(), suffix=".blm", delete=DELETE_TEMP_FILES) as fobj:
+            blm = BloomFilterOnDisk(fobj.name, 10, 0.05)
+            blm.add_many(["this is a test", "this is another test"])
+            self.assertEqual(blm.elements_added, 2)
+            self.assertEqual(blm.check_many(["this is a test", "this is yet another test"]), [True, False])
+            blm.close()
+
+            blm2 = BloomFilterOnDisk(fobj.name)
+            self.assertEqual(blm2.check("this is another test"), True)
+            blm2.close()
+
     def test_bfod_union(self):
         """test the union of two bloom filters on disk"""
         with NamedTemporaryFile(dir=os.getcwd(), suffix=".blm", delete=DELETE_TEMP_FILES) as fobj:
@@ -852,6 +903,11 @@ class TestBloomFilterOnDisk(unittest.TestCase):
             self.assertEqual(blm.elements_added, 0)
             for idx in range(blm.bloom_length):
                 self.assertEqual(blm._get_element(idx), 0)
+            blm.close()
+
+            blm2 = BloomFilterOnDisk(filepath=fobj.name)
+            self.assertEqual(blm2.check("this is a test 0"), False)
+            blm2.close()
 
     def test_bfod_union_diff(self):
         """make sure checking for different bloom filters on disk works union"""
@@ -59,6 +59,12 @@ class TestCountingBloomFilter(unittest.TestCase):
         self.assertEqual(blm.check("this is yet another test"), False)
         self.assertEqual(blm.check("this is not another test"), False)
 
+    def test_cbf_check_many(self):
+        """ensure that checking many keys returns the counts"""
+        blm = CountingBloomFilter(est_elements=10, false_positive_rate=0.05)
+        blm.add_many(["a", "a", "b"])
+        self.assertEqual(blm.check_many(["a", "b", "z"]), [2, 1, 0])
+
     def test_cbf_in_check(self):
         """check that the in construct works"""
         blm = CountingBloomFilter(est_elements=10, false_positive_rate=0.05)
@@ -83,6 +83,25 @@ class TestExpandingBloomFilter(unittest.TestCase):
         self.assertEqual("this is yet another test!" in blm, False)
         self.assertEqual("this is not another test" in blm, False)
 
+    def test_ebf_add_many(self):
+        """ensure adding many keys matches adding them one at a time"""
+        blm = ExpandingBloomFilter(est_elements=10, false_positive_rate=0.05)
+        blm.add_many(("{}".format(i) for i in range(100)), True)
+        blm2 = ExpandingBloomFilter(est_elements=10, false_positive_rate=0.05)
+        for i in range(100):
+            blm2.add("{}".format(i), True)
+        self.assertEqual(blm.expansions, 9)
+        self.assertEqual(blm.elements_added, 100)
+        self.assertEqual(bytes(blm), bytes(blm2))
+
+    def test_ebf_check_many(self):
+        """ensure checking many keys across the expansions works"""
+        blm = ExpandingBloomFilter(est_elements=30, false_positive_rate=0.05)
+        blm.add_many("{}".format(i) for i in range(100))
+        self.assertGreater(blm.expansions, 1)
+        res = blm.check_many(["0", "50", "99", "this is not another test"])
+        self.assertEqual(res, [True, True, True, False])
+
     def test_ebf_push(self):
         """ensure that we are able to push new Bloom Filters"""
         blm = ExpandingBloomFilter(est_elements=25, false_positive_rate=0.05)
@@ -200,6 +219,13 @@ class TestRotatingBloomFilter(unittest.TestCase):
 
         self.assertEqual(blm.elements_added, 51)
 
+    def test_rbf_add_many(self):
+        """ensure adding many keys rotates the Bloom Filters"""
+        blm = RotatingBloomFilter(est_elements=10, false_positive_rate=0.05, max_queue_size=5)
+        blm.add_many(("{}".format(i) for i in range(60)), True)
+        self.assertEqual(blm.current_queue_size, 5)
+        self.assertEqual(blm.check_many(["0", "59"]), [False, True])
+
     def test_rbf_push_pop(self):
         """test forcing push and pop"""
         blm = RotatingBloomFilter(est_elements=10, false_positive_rate=0.05, max_queue_size=5)
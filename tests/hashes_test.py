@@ -14,11 +14,13 @@ sys.path.insert(0, str(this_dir.parent))
 from probables.constants import UINT64_T_MAX
 from probables.hashes import (
     default_fnv_1a,
+    default_fnv_1a_double,
     default_md5,
     default_sha256,
     fnv_1a_32,
     hash_with_depth_bytes,
     hash_with_depth_int,
+    hash_with_double_hashing,
 )
 
 
@@ -46,6 +48,19 @@ class TestHashes(unittest.TestCase):
         hashes = default_fnv_1a("this is also a test", 5)
         self.assertEqual(hashes, this_is_also)
 
+    def test_default_fnv_1a_double(self):
+        """test default fnv-1a double hashing algorithm"""
+        this_is_a_test = [
+            4040040117721899264,
+            7956537297877286041,
+            11873034478032672818,
+            15789531658188059595,
+            1259284764633894756,
+        ]
+        hashes = default_fnv_1a_double("this is a test", 5)
+        self.assertEqual(hashes, this_is_a_test)
+        self.assertEqual(default_fnv_1a_double("this is a test"), default_fnv_1a("this is a test"))
+
     def test_default_hash_colision(self):
         """test when different strings start with the same hash value (issue 62)"""
         h1 = default_fnv_1a("gMPflVXtwGDXbIhP73TX", 5)
@@ -146,6 +161,34 @@ class TestHashes(unittest.TestCase):
         self.assertEqual(len(res), 1)
         self.assertEqual(res[0], results[0])
 
+    def test_hash_double_hashing_decorator(self):
+        """test making a double hashing strategy with decorator"""
+        max64mod = UINT64_T_MAX + 1
+
+        @hash_with_double_hashing
+        def my_hash(key, seed=0, encoding="utf-8"):
+            """my hash function"""
+            val = int(hashlib.sha512(key.encode(encoding) + bytes([seed])).hexdigest(), 16)
+            return val % max64mod
+
+        h1 = my_hash.__wrapped__("this is a test", 0)
+        h2 = my_hash.__wrapped__("this is a test", 1) | 1
+        results = [(h1 + i * h2) % max64mod for i in range(5)]
+        self.assertEqual(my_hash("this is a test", 5), results)
+        res = my_hash("this is a test", 1)
+        self.assertEqual(len(res), 1)
+        self.assertEqual(res[0], results[0])
+
+    def test_hash_double_hashing_odd(self):
+        """test the double hashing strategy when the second hash is even"""
+
+        @hash_with_double_hashing
+        def my_hash(key, seed=0):
+            """my hash function"""
+            return 100 if seed == 0 else 0
+
+        self.assertEqual(my_hash("this is a test", 4), [100, 101, 102, 103])
+
     def test_default_fnv_1a_bytes(self):
         """test default fnv-1a algorithm"""
         this_is_a_test = [
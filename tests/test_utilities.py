@@ -11,7 +11,17 @@ this_dir = Path(__file__).parent
 sys.path.insert(0, str(this_dir))
 sys.path.insert(0, str(this_dir.parent))
 
-from probables.utilities import Bitarray, MMap, get_x_bits, is_hex_string, is_valid_file, resolve_path
+from probables import utilities
+from probables.utilities import (
+    Bitarray,
+    MMap,
+    get_x_bits,
+    is_hex_string,
+    is_valid_file,
+    popcount,
+    popcount_int,
+    resolve_path,
+)
 from tests.utilities import different_hash
 
 DELETE_TEMP_FILES = True
@@ -82,6 +92,37 @@ class TestProbablesUtilities(unittest.TestCase):
         self.assertEqual(1, tmp1)
         self.assertEqual(1, tmp2)
 
+    def test_popcount(self):
+        """test counting the number of set bits"""
+        data = bytes(range(256))
+        self.assertEqual(popcount(b""), 0)
+        self.assertEqual(popcount(bytes(10)), 0)
+        self.assertEqual(popcount(b"\xff" * 10), 80)
+        self.assertEqual(popcount(data), 1024)
+
+        has_bit_count = utilities._HAS_BIT_COUNT
+        try:
+            utilities._HAS_BIT_COUNT = False  # force the lookup table
+            self.assertEqual(popcount(b"\xff" * 10), 80)
+            self.assertEqual(popcount(data), 1024)
+        finally:
+            utilities._HAS_BIT_COUNT = has_bit_count
+
+    def test_popcount_int(self):
+        """test counting the number of set bits in an integer"""
+        self.assertEqual(popcount_int(0), 0)
+        self.assertEqual(popcount_int(255), 8)
+        self.assertEqual(popcount_int((1 << 1000) | 1), 2)
+
+        has_bit_count = utilities._HAS_BIT_COUNT
+        try:
+            utilities._HAS_BIT_COUNT = False  # force the lookup table
+            self.assertEqual(popcount_int(0), 0)
+            self.assertEqual(popcount_int(255), 8)
+            self.assertEqual(popcount_int((1 << 1000) | 1), 2)
+        finally:
+            utilities._HAS_BIT_COUNT = has_bit_count
+
     def test_mmap_functionality(self):
         """test some of the MMap class functionality"""
         data = b"this is a test of the MMap system!"